@@ -1,29 +1,82 @@
 import os
+import functools
+import hashlib
+import hmac
+import json
+import mmap
+import secrets
 import subprocess
+import tempfile
+import threading
 import time
 import difflib
 import sys
 from pathlib import Path
 import click
-import yaml
-import requests
-from loguru import logger
-from jinja2 import Environment, FileSystemLoader
+
+# yaml, jinja2, requests, loguru, http.server and concurrent.futures are
+# imported where they're used, so `--help` and commands that don't need them
+# start quickly
 
 
 # ---------- helpers ----------
-def load_project(cfg_path: str):
-    data = yaml.safe_load(Path(cfg_path).read_text(encoding="utf-8"))
-    # tiny validation
-    for k in ["service", "provider", "repository", "branches"]:
+# required config keys and the type each must have
+_SCHEMA = {"service": str, "provider": str, "repository": str, "branches": list}
+
+
+def _validate(data) -> str | None:
+    if not isinstance(data, dict):
+        return "expected a mapping at the top level"
+    for k, typ in _SCHEMA.items():
         if k not in data:
-            raise click.ClickException(f"Missing '{k}' in {cfg_path}")
+            return f"Missing '{k}'"
+        if not isinstance(data[k], typ):
+            return f"'{k}' must be a {typ.__name__}, got {type(data[k]).__name__}"
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int):
+    # mtime/size are only part of the cache key: an edited file misses the cache
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=loader)
+    # validation is cached alongside the parse, so it runs once per file version
+    return data, _validate(data)
+
+
+def load_project(cfg_path: str):
+    st = os.stat(cfg_path)
+    data, error = _load_cached(os.path.abspath(cfg_path), st.st_mtime_ns, st.st_size)
+    if error:
+        raise click.ClickException(f"{error} in {cfg_path}")
     return data
 
 
+@functools.lru_cache(maxsize=8)
+def _env_for(template_dir: str):
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    # bytecode cache lives in a per-user temp dir and is keyed on template source,
+    # so later invocations skip parsing/compiling unchanged templates
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+
+
+@functools.cache
+def _resolve_template_dir(provider: str, override: Path | None) -> Path:
+    base = override if override is not None else Path(__file__).parent / "templates"
+    return base / provider
+
+
 def render_pipeline(project: dict, template_dir: Path) -> str:
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    tpl = env.get_template("ci.yml.j2")
+    # key on the absolute path: the same relative dir differs between working dirs
+    tpl = _env_for(str(Path(template_dir).resolve())).get_template("ci.yml.j2")
     return tpl.render(
         service=project["service"],
         branches=project["branches"],
@@ -35,31 +88,179 @@ def write_pipeline(text: str, path: Path):
     path.write_text(text, encoding="utf-8")
 
 
+def _same_content(path: Path, data: bytes) -> bool:
+    """Byte-compare a file with `data` through mmap, without copying it in."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return False
+    if size != len(data):
+        return False
+    if not size:
+        return True  # mmap can't map an empty file
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return view == data
+
+
 def git(*args):
     subprocess.run(["git", *args], check=True)
 
 
-def gh_api(token: str, method: str, path: str, **kw):
-    url = f"https://api.github.com{path}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-    }
-    return requests.request(method, url, headers=headers, **kw)
+def git_output(*args) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], check=True, capture_output=True, text=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        # stderr was captured, so surface git's own message
+        raise click.ClickException(
+            f"git {' '.join(args)} failed: {e.stderr.strip()}"
+        ) from e
+
+
+# keep-alive connections kept per host; also the cap on status --workers, since
+# more threads than pooled connections would discard connections after use
+_POOL_SIZE = 8
+
+
+@functools.cache
+def _session():
+    # one keep-alive session for all GitHub calls, so polling reuses the TLS connection
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["Accept"] = "application/vnd.github+json"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=_POOL_SIZE,
+            # hand back the last response once retries are spent, so callers
+            # report the status code instead of crashing on RetryError
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+GITHUB_API = "https://api.github.com"
+
+
+def gh_api(token: str, method: str, path: str, headers: dict | None = None, **kw):
+    url = f"{GITHUB_API}{path}"
+    headers = {**(headers or {}), "Authorization": f"Bearer {token}"}
+    kw.setdefault("timeout", 10)
+    return _session().request(method, url, headers=headers, **kw)
+
+
+@functools.cache
+def _json_loads():
+    # orjson parses straight from bytes and is several times faster on the
+    # run listings; fall back to the stdlib when it isn't installed
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def _json(r):
+    return _json_loads()(r.content)
+
+
+def gh_get_cached(token: str, path: str, params: dict | None = None, ttl: int = 30):
+    """GET a JSON body through a small on-disk cache shared across invocations.
+
+    Entries younger than `ttl` seconds are served without touching the network;
+    older ones are revalidated with If-None-Match, so an unchanged resource costs
+    a bodyless 304 that doesn't count against the rate limit.
+    """
+    cache_file = Path(click.get_app_dir("cicd-tool")) / "http-cache.json"
+    try:
+        cache = _json_loads()(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    # key on the token too, so one token never sees what another fetched
+    owner = hashlib.sha256(token.encode()).hexdigest()[:16]
+    key = f"{owner} {path}?{sorted((params or {}).items())}"
+    entry = cache.get(key)
+    now = time.time()
+    if entry and now - entry["time"] < ttl:
+        return entry["body"]
+
+    etag = entry and entry.get("etag")
+    r = gh_api(
+        token,
+        "GET",
+        path,
+        headers={"If-None-Match": etag} if etag else None,
+        params=params,
+    )
+    if r.status_code == 304 and entry:
+        entry["time"] = now
+    elif r.status_code == 200:
+        entry = cache[key] = {
+            "etag": r.headers.get("ETag"),
+            "time": now,
+            "body": _json(r),
+        }
+    else:
+        raise click.ClickException(f"GET {path} failed: {r.status_code} {r.text}")
+
+    # drop day-old entries so the file doesn't grow without bound
+    cache = {k: v for k, v in cache.items() if now - v["time"] < 86400}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # a per-process temp file, so concurrent runs never replace each other's
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_file.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp:
+            json.dump(cache, tmp)
+        os.replace(tmp.name, cache_file)
+    except OSError as e:
+        # the data is already in hand; a cache we can't write is only slower
+        from loguru import logger
+
+        logger.warning(f"HTTP cache write failed: {e}")
+    return entry["body"]
+
+
+# REST has no field selection, but run objects can embed every associated PR;
+# we never read those, so ask GitHub to leave them out of run payloads
+_SLIM_RUNS = {"exclude_pull_requests": "true"}
+
+
+def _branch_filter(proj: dict) -> dict:
+    branch = proj.get("default_branch")
+    return {"branch": branch} if branch else {}
 
 
 def slack_notify(text: str, webhook: str | None):
     if not webhook:
         return
+    import requests
+
     try:
         requests.post(webhook, json={"text": text}, timeout=5)
     except Exception as e:
+        from loguru import logger
+
         logger.warning(f"Slack notify failed: {e}")
 
 
 # ---------- CLI ----------
 @click.group()
 def cli():
+    from loguru import logger
+
     logger.add("cicd.log", rotation="500 KB")
 
 
@@ -73,10 +274,7 @@ def cli():
 def init(config, template_dir):
     """Render pipeline file locally (no git changes)."""
     proj = load_project(config)
-    if template_dir is None:
-        template_dir = Path(__file__).parent / "templates" / proj["provider"]
-    else:
-        template_dir = template_dir / proj["provider"]
+    template_dir = _resolve_template_dir(proj["provider"], template_dir)
     out = render_pipeline(proj, template_dir)
     path = Path(".github/workflows/ci.yml")
     write_pipeline(out, path)
@@ -93,25 +291,28 @@ def init(config, template_dir):
 def plan(config, template_dir):
     """Show diff between rendered and current file."""
     proj = load_project(config)
-    if template_dir is None:
-        template_dir = Path(__file__).parent / "templates" / proj["provider"]
-    else:
-        template_dir = template_dir / proj["provider"]
+    template_dir = _resolve_template_dir(proj["provider"], template_dir)
     new_text = render_pipeline(proj, template_dir)
     path = Path(".github/workflows/ci.yml")
+    # common case: byte-identical file, decided without reading it into a str
+    if _same_content(path, new_text.encode("utf-8")):
+        click.echo("No changes.")
+        return
     old_text = path.read_text(encoding="utf-8") if path.exists() else ""
+    if old_text == new_text:
+        click.echo("No changes.")
+        return
     diff = difflib.unified_diff(
         old_text.splitlines(True),
         new_text.splitlines(True),
         fromfile="current",
         tofile="rendered",
     )
-    out = "".join(diff)
-    if out:
-        click.echo(out)
-        sys.exit(1)
-    else:
-        click.echo("No changes.")
+    # stream the diff instead of joining it into one big string first
+    for line in diff:
+        click.echo(line, nl=False)
+    click.echo()
+    sys.exit(1)
 
 
 @cli.command()
@@ -126,17 +327,25 @@ def plan(config, template_dir):
 def push(config, branch, base, template_dir):
     """Commit rendered workflow to a branch and open a PR."""
     proj = load_project(config)
-    if template_dir is None:
-        template_dir = Path(__file__).parent / "templates" / proj["provider"]
-    else:
-        template_dir = template_dir / proj["provider"]
+    template_dir = _resolve_template_dir(proj["provider"], template_dir)
     rendered = render_pipeline(proj, template_dir)
     path = Path(".github/workflows/ci.yml")
-    write_pipeline(rendered, path)
+    if not _same_content(path, rendered.encode("utf-8")):
+        write_pipeline(rendered, path)
+
+    # nothing to commit if the workflow already matches HEAD; skip the git
+    # round-trips (and an empty commit, which would fail) entirely
+    state = git_output("status", "--porcelain", "--", str(path))
+    if not state:
+        click.echo("Up-to-date, skipping push.")
+        return
 
     git("checkout", "-B", branch)
-    git("add", ".github/workflows/ci.yml")
-    git("commit", "-m", "chore: manage CI with tool")
+    # a tracked file can be committed by pathspec directly; only a new file
+    # needs `git add` first
+    if state.startswith("??"):
+        git("add", ".github/workflows/ci.yml")
+    git("commit", "-m", "chore: manage CI with tool", "--", ".github/workflows/ci.yml")
     git("push", "-u", "origin", branch, "-f")
 
     token = os.environ.get("GITHUB_TOKEN")
@@ -151,20 +360,72 @@ def push(config, branch, base, template_dir):
     )
     if r.status_code >= 300:
         raise click.ClickException(f"PR create failed: {r.status_code} {r.text}")
-    click.echo(f"PR created: {r.json().get('html_url')}")
+    click.echo(f"PR created: {_json(r).get('html_url')}")
 
 
 @cli.command()
 @click.option("--config", default="examples/project.yaml")
 @click.option("--branch", default="main")
 @click.option("--watch/--no-watch", default=True)
-def run(config, branch, watch):
+@click.option(
+    "--webhook-port",
+    type=int,
+    default=None,
+    help="Wait for a workflow_run webhook on this local port instead of polling.",
+)
+@click.option(
+    "--webhook-url",
+    default=None,
+    help="Public URL forwarding to --webhook-port (e.g. a smee.io channel).",
+)
+@click.option(
+    "--webhook-host",
+    default="127.0.0.1",
+    show_default=True,
+    help="Interface for the webhook listener; 0.0.0.0 to accept from any host.",
+)
+@click.option(
+    "--webhook-timeout",
+    type=click.IntRange(min=1),
+    default=1800,
+    show_default=True,
+    help="Seconds to wait on the webhook before falling back to polling.",
+)
+@click.option(
+    "--find-timeout",
+    type=click.IntRange(min=1),
+    default=60,
+    show_default=True,
+    help="Seconds to wait for the dispatched run to show up.",
+)
+@click.option(
+    "--fail-fast", is_flag=True, help="Exit non-zero unless the run succeeds."
+)
+def run(
+    config,
+    branch,
+    watch,
+    webhook_port,
+    webhook_url,
+    webhook_host,
+    webhook_timeout,
+    find_timeout,
+    fail_fast,
+):
     """Manually trigger the workflow on a branch and optionally watch status."""
+    if webhook_port and not webhook_url:
+        raise click.UsageError("--webhook-url is required with --webhook-port.")
+    if fail_fast and not watch:
+        raise click.UsageError("--fail-fast needs --watch to see how the run ends.")
     proj = load_project(config)
     token = os.environ.get("GITHUB_TOKEN")
     if not token:
         raise click.ClickException("Set GITHUB_TOKEN (repo scope).")
 
+    # run ids only grow, so anything newer than this one is ours; no clocks involved
+    before = _latest_dispatch_run(proj, token, branch)
+    after_id = before["id"] if before else 0
+
     # trigger (workflow file must be named ci.yml)
     r = gh_api(
         token,
@@ -176,55 +437,329 @@ def run(config, branch, watch):
         raise click.ClickException(f"Dispatch failed: {r.status_code} {r.text}")
     click.echo("Triggered workflow_dispatch.")
 
-    time.sleep(3)
+    run = _find_dispatched_run(proj, token, branch, after_id, find_timeout)
+    run_id, url = run["id"], run["html_url"]
+    click.echo(f"Run: {run_id} -> {url}")
+
+    if watch:
+        j, notifier = _watch(
+            proj,
+            token,
+            run_id,
+            webhook_port,
+            webhook_url,
+            webhook_timeout,
+            webhook_host,
+        )
+        if notifier:
+            # bounded by slack_notify's own 5s request timeout
+            notifier.join()
+        if fail_fast and j.get("conclusion") != "success":
+            sys.exit(1)
+
+
+def _latest_dispatch_run(proj, token, branch) -> dict | None:
     rr = gh_api(
         token,
         "GET",
         f"/repos/{proj['repository']}/actions/runs",
-        params={"branch": branch},
+        params={
+            "per_page": 1,
+            "event": "workflow_dispatch",
+            "branch": branch,
+            **_SLIM_RUNS,
+        },
     )
-    run = rr.json()["workflow_runs"][0]
-    run_id, url = run["id"], run["html_url"]
-    click.echo(f"Run: {run_id} -> {url}")
+    if rr.status_code != 200:
+        raise click.ClickException(f"Run lookup failed: {rr.status_code} {rr.text}")
+    runs = _json(rr).get("workflow_runs", [])
+    return runs[0] if runs else None
+
+
+def _find_dispatched_run(proj, token, branch, after_id, timeout=60):
+    # the run appears a moment after dispatch; check right away and then
+    # briefly back off rather than always sleeping a fixed interval. Until it
+    # is listed the newest run is an older one, which the id check skips.
+    deadline = time.monotonic() + timeout
+    while True:
+        run = _latest_dispatch_run(proj, token, branch)
+        if run and run["id"] > after_id:
+            return run
+        if time.monotonic() >= deadline:
+            raise click.ClickException(
+                f"Dispatched run did not show up within {timeout}s; "
+                "check the Actions tab."
+            )
+        time.sleep(0.5)
 
-    if watch:
-        _watch(proj, token, run_id)
 
+def _poll_delay(r, default: int = 5) -> int:
+    # GitHub asks clients to back off via these headers; honor them over our default
+    for h in ("Retry-After", "X-Poll-Interval"):
+        v = r.headers.get(h, "")
+        if v.isdigit():
+            return int(v)
+    return default
 
-def _watch(proj, token, run_id):
+
+_FAILED_CONCLUSIONS = {"failure", "cancelled", "timed_out", "action_required"}
+
+
+def _run_finished(j: dict) -> bool:
+    # a known-bad conclusion won't change, so don't wait out cleanup
+    return j["status"] == "completed" or j.get("conclusion") in _FAILED_CONCLUSIONS
+
+
+def _poll_run(proj, token, run_id):
     last = ""
+    etag = None
     while True:
-        r = gh_api(token, "GET", f"/repos/{proj['repository']}/actions/runs/{run_id}")
-        j = r.json()
-        status = f"{j['status']}/{j.get('conclusion')}"
-        if status != last:
-            click.echo(f"[{time.strftime('%H:%M:%S')}] {status}")
-            last = status
-        if j["status"] == "completed":
-            # Optional Slack
-            webhook = (proj.get("notifications") or {}).get("slack_webhook", "")
-            slack_notify(
-                f"CI for {proj['repository']} finished: {j.get('conclusion')}", webhook
-            )
-            break
-        time.sleep(5)
+        # conditional request: an unchanged run is a bodyless 304 that doesn't
+        # count against the rate limit
+        r = gh_api(
+            token,
+            "GET",
+            f"/repos/{proj['repository']}/actions/runs/{run_id}",
+            headers={"If-None-Match": etag} if etag else None,
+            params=_SLIM_RUNS,
+        )
+        if r.status_code == 200:
+            etag = r.headers.get("ETag")
+            j = _json(r)
+            status = f"{j['status']}/{j.get('conclusion')}"
+            if status != last:
+                click.echo(f"[{time.strftime('%H:%M:%S')}] {status}")
+                last = status
+            if _run_finished(j):
+                return j
+        elif r.status_code != 304 and "Retry-After" not in r.headers:
+            raise click.ClickException(f"Run lookup failed: {r.status_code} {r.text}")
+        time.sleep(_poll_delay(r))
+
+
+@functools.cache
+def _webhook_handler():
+    # built on first use so http.server is only imported for --webhook-port
+    from http.server import BaseHTTPRequestHandler
+
+    class _WebhookHandler(BaseHTTPRequestHandler):
+        """Accepts signed workflow_run deliveries for the run being watched."""
+
+        def do_POST(self):
+            srv = self.server
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                self.send_response(400)
+                self.end_headers()
+                return
+            body = self.rfile.read(length)
+            sig = "sha256=" + hmac.new(srv.secret, body, hashlib.sha256).hexdigest()
+            if not hmac.compare_digest(
+                sig, self.headers.get("X-Hub-Signature-256", "")
+            ):
+                self.send_response(401)
+                self.end_headers()
+                return
+            self.send_response(204)
+            self.end_headers()
+            if self.headers.get("X-GitHub-Event") != "workflow_run":
+                return
+            event = _json_loads()(body)
+            run = event.get("workflow_run") or {}
+            if event.get("action") == "completed" and run.get("id") == srv.run_id:
+                srv.run = run
+                srv.done.set()
+
+        def log_message(self, format, *args):
+            pass  # keep per-request access logs out of the CLI output
+
+    return _WebhookHandler
+
+
+def _webhook_server(port: int, run_id: int, host: str = "127.0.0.1"):
+    from http.server import ThreadingHTTPServer
+
+    srv = ThreadingHTTPServer((host, port), _webhook_handler())
+    srv.secret = secrets.token_hex(32).encode()
+    srv.run_id = run_id
+    srv.run = None
+    srv.done = threading.Event()
+    return srv
+
+
+# while waiting on a delivery, re-check the run over REST this often, so a
+# lost delivery costs at most this much latency
+_WEBHOOK_RECHECK = 30
+
+
+def _get_run(proj, token, run_id) -> dict:
+    r = gh_api(
+        token,
+        "GET",
+        f"/repos/{proj['repository']}/actions/runs/{run_id}",
+        params=_SLIM_RUNS,
+    )
+    if r.status_code != 200:
+        raise click.ClickException(f"Run lookup failed: {r.status_code} {r.text}")
+    return _json(r)
+
+
+def _wait_webhook(proj, token, run_id, port, url, timeout, host="127.0.0.1"):
+    """Block until GitHub delivers workflow_run.completed; None to fall back."""
+    try:
+        srv = _webhook_server(port, run_id, host)
+    except OSError as e:
+        click.echo(f"Webhook listener failed ({e}); falling back to polling.")
+        return None
+
+    r = gh_api(
+        token,
+        "POST",
+        f"/repos/{proj['repository']}/hooks",
+        json={
+            "name": "web",
+            "active": True,
+            "events": ["workflow_run"],
+            "config": {
+                "url": url,
+                "content_type": "json",
+                "secret": srv.secret.decode(),
+            },
+        },
+    )
+    if r.status_code >= 300:
+        srv.server_close()
+        click.echo(
+            f"Webhook registration failed ({r.status_code}); falling back to polling."
+        )
+        return None
+    hook_id = _json(r)["id"]
+
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        # the run may already have finished before the hook existed
+        j = _get_run(proj, token, run_id)
+        if not _run_finished(j):
+            click.echo(f"[{time.strftime('%H:%M:%S')}] waiting for webhook on :{port}")
+            deadline = time.monotonic() + timeout
+            while not srv.done.wait(
+                max(0, min(_WEBHOOK_RECHECK, deadline - time.monotonic()))
+            ):
+                j = _get_run(proj, token, run_id)
+                if _run_finished(j):
+                    break
+                if time.monotonic() >= deadline:
+                    click.echo(
+                        f"No webhook delivery within {timeout}s; falling back to polling."
+                    )
+                    return None
+            else:
+                j = srv.run
+        click.echo(f"[{time.strftime('%H:%M:%S')}] {j['status']}/{j.get('conclusion')}")
+        return j
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        gh_api(token, "DELETE", f"/repos/{proj['repository']}/hooks/{hook_id}")
+
+
+def _watch(
+    proj,
+    token,
+    run_id,
+    webhook_port=None,
+    webhook_url=None,
+    webhook_timeout=1800,
+    webhook_host="127.0.0.1",
+):
+    j = None
+    if webhook_port:
+        j = _wait_webhook(
+            proj,
+            token,
+            run_id,
+            webhook_port,
+            webhook_url,
+            webhook_timeout,
+            webhook_host,
+        )
+    if j is None:
+        j = _poll_run(proj, token, run_id)
+    # Optional Slack, posted in the background while the caller finishes up;
+    # the caller joins the thread before exiting so the notice is never dropped
+    notifier = None
+    webhook = (proj.get("notifications") or {}).get("slack_webhook", "")
+    if webhook:
+        notifier = threading.Thread(
+            target=slack_notify,
+            args=(
+                f"CI for {proj['repository']} finished: {j.get('conclusion')}",
+                webhook,
+            ),
+        )
+        notifier.start()
+    return j, notifier
 
 
 @cli.command()
 @click.option("--config", default="examples/project.yaml")
 @click.option("--last", default=5)
-def status(config, last):
+@click.option("--show-jobs", is_flag=True, help="Also list each run's jobs.")
+@click.option(
+    "--workers",
+    type=click.IntRange(1, _POOL_SIZE),
+    default=_POOL_SIZE,
+    show_default=True,
+    help="Parallel requests for --show-jobs.",
+)
+@click.option("--no-cache", is_flag=True, help="Always fetch fresh run data.")
+def status(config, last, show_jobs, workers, no_cache):
     """List recent runs with status + links."""
     proj = load_project(config)
     token = os.environ.get("GITHUB_TOKEN")
     if not token:
         raise click.ClickException("Set GITHUB_TOKEN (repo scope).")
-    r = gh_api(token, "GET", f"/repos/{proj['repository']}/actions/runs")
-    runs = r.json().get("workflow_runs", [])[:last]
-    for run in runs:
-        click.echo(
-            f"{run['id']}  {run['status']}/{run.get('conclusion')}  {run['html_url']}"
+    # let the server return exactly `last` runs instead of 30 we'd mostly discard
+    body = gh_get_cached(
+        token,
+        f"/repos/{proj['repository']}/actions/runs",
+        params={"per_page": last, "page": 1, **_branch_filter(proj), **_SLIM_RUNS},
+        ttl=0 if no_cache else 30,
+    )
+    runs = body.get("workflow_runs", [])
+    if not show_jobs:
+        for run in runs:
+            _echo_run(run)
+        return
+
+    # fan the per-run lookups out over the shared session; map() yields in run
+    # order, so each run prints as soon as it and the ones above it are in
+    def fetch_jobs(run):
+        rj = gh_api(
+            token, "GET", f"/repos/{proj['repository']}/actions/runs/{run['id']}/jobs"
         )
+        if rj.status_code != 200:
+            raise click.ClickException(
+                f"Job lookup for run {run['id']} failed: {rj.status_code} {rj.text}"
+            )
+        return _json(rj).get("jobs", [])
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for run, jobs in zip(runs, ex.map(fetch_jobs, runs)):
+            _echo_run(run)
+            for job in jobs:
+                click.echo(
+                    f"    {job['name']}  {job['status']}/{job.get('conclusion')}"
+                )
+
+
+def _echo_run(run):
+    click.echo(
+        f"{run['id']}  {run['status']}/{run.get('conclusion')}  {run['html_url']}"
+    )
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from pathlib import Path
 from click.testing import CliRunner
 import sys
 import os
+import json
 
 # Add the project root to the python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -10,6 +11,37 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from cli import load_project, cli
 
 
+class FakeResponse:
+    """Just enough of requests.Response for the cli helpers."""
+
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        # a 304 has no body, so decoding one would fail loudly
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.text = self.content.decode()
+
+
+def fake_api(monkeypatch, responses):
+    """Serve `responses` in order from gh_api; returns the list of calls made."""
+    import cli as cli_module
+
+    calls = []
+
+    def fake_gh_api(token, method, path, headers=None, **kw):
+        calls.append({"method": method, "path": path, "headers": headers, **kw})
+        return responses.pop(0)
+
+    monkeypatch.setattr(cli_module, "gh_api", fake_gh_api)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(monkeypatch, tmp_path):
+    # CLI invocations write cicd.log and config files into the working directory
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def project_file_content():
     return """
@@ -39,6 +71,31 @@ def test_load_project(project_file):
     assert project["branches"] == ["main", "dev"]
 
 
+def test_load_project_cache(project_file):
+    """Tests that an unchanged config is parsed once and an edited one is re-read."""
+    assert load_project(project_file) is load_project(project_file)
+
+    path = Path(project_file)
+    path.write_text(path.read_text().replace("my-service", "other-service"))
+    assert load_project(project_file)["service"] == "other-service"
+
+
+def test_load_project_validation(project_file):
+    """Tests that missing keys and wrongly typed values are rejected."""
+    import click
+
+    path = Path(project_file)
+    path.write_text(
+        "service: my-service\nprovider: github\nrepository: my-org/my-repo\n"
+    )
+    with pytest.raises(click.ClickException, match="Missing 'branches'"):
+        load_project(project_file)
+
+    path.write_text(path.read_text() + "branches: main\n")
+    with pytest.raises(click.ClickException, match="'branches' must be a list"):
+        load_project(project_file)
+
+
 @pytest.fixture
 def runner():
     return CliRunner()
@@ -100,6 +157,22 @@ def test_render_pipeline():
     assert rendered_content == golden_content
 
 
+def test_render_pipeline_per_directory(runner):
+    """Tests that the same relative template dir in another cwd isn't served stale."""
+    from cli import render_pipeline
+
+    project = {"service": "s", "branches": ["main"]}
+    rendered = []
+    for label in ("A", "B"):
+        with runner.isolated_filesystem():
+            template_dir = Path("t/github")
+            template_dir.mkdir(parents=True)
+            (template_dir / "ci.yml.j2").write_text(label + " {{ service }}")
+            rendered.append(render_pipeline(project, template_dir))
+
+    assert rendered == ["A s", "B s"]
+
+
 def test_plan_command(runner, project_file_content):
     """Tests the plan command."""
     with runner.isolated_filesystem():
@@ -152,3 +225,617 @@ def test_plan_command(runner, project_file_content):
 
         assert result.exit_code == 0
         assert "No changes." in result.output
+
+
+def test_push_skips_when_up_to_date(runner, project_file_content):
+    """Tests that push does nothing when the rendered workflow is already committed."""
+    import subprocess
+
+    with runner.isolated_filesystem():
+        with open("project.yaml", "w") as f:
+            f.write(project_file_content)
+
+        template_dir = Path("dummy_templates/github")
+        template_dir.mkdir(parents=True, exist_ok=True)
+        with open(template_dir / "ci.yml.j2", "w") as f:
+            f.write("Hello from a dummy template! Branches: {{ branches|join(', ') }}")
+
+        args = ["--config", "project.yaml", "--template-dir", str(template_dir.parent)]
+        assert runner.invoke(cli, ["init", *args]).exit_code == 0
+
+        def git(*a):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *a],
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q")
+        git("add", ".github/workflows/ci.yml")
+        git("commit", "-q", "-m", "add workflow")
+
+        result = runner.invoke(cli, ["push", *args])
+
+        assert result.exit_code == 0
+        assert "Up-to-date, skipping push." in result.output
+
+
+def test_push_outside_git_repo(runner, project_file_content, monkeypatch, tmp_path):
+    """Tests that push shows git's own error when run outside a repository."""
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    Path("project.yaml").write_text(project_file_content)
+
+    result = runner.invoke(cli, ["push", "--config", "project.yaml"])
+
+    assert result.exit_code == 1
+    assert "not a git repository" in result.output
+
+
+RUNS_BODY = {
+    "workflow_runs": [
+        {
+            "id": 1,
+            "status": "completed",
+            "conclusion": "success",
+            "html_url": "https://example.com/1",
+        }
+    ]
+}
+
+
+@pytest.fixture
+def status_env(monkeypatch, tmp_path, project_file):
+    """A token and a private app dir for status's HTTP cache."""
+    import cli as cli_module
+
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(cli_module.click, "get_app_dir", lambda name: str(tmp_path))
+    return ["status", "--config", project_file]
+
+
+def test_status_uses_http_cache(runner, monkeypatch, status_env):
+    """Tests that a repeated status within the cache TTL doesn't hit the API."""
+    calls = fake_api(monkeypatch, [FakeResponse(200, RUNS_BODY, {"ETag": '"abc"'})])
+
+    for _ in range(2):
+        result = runner.invoke(cli, status_env)
+        assert result.exit_code == 0
+        assert "1  completed/success  https://example.com/1" in result.output
+
+    assert len(calls) == 1
+
+
+def test_status_cache_revalidates(runner, monkeypatch, status_env):
+    """Tests that stale and --no-cache lookups send the ETag and reuse a 304."""
+    import cli as cli_module
+
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(200, RUNS_BODY, {"ETag": '"abc"'}),
+            FakeResponse(304),
+            FakeResponse(304),
+        ],
+    )
+    real_time = cli_module.time.time
+
+    assert runner.invoke(cli, status_env).exit_code == 0
+
+    # --no-cache skips the freshness window but still revalidates
+    result = runner.invoke(cli, [*status_env, "--no-cache"])
+    assert result.exit_code == 0
+    assert "1  completed/success" in result.output
+
+    # past the TTL, a plain status revalidates as well
+    monkeypatch.setattr(cli_module.time, "time", lambda: real_time() + 60)
+    result = runner.invoke(cli, status_env)
+    assert result.exit_code == 0
+    assert "1  completed/success" in result.output
+
+    assert [c["headers"] for c in calls] == [None] + [{"If-None-Match": '"abc"'}] * 2
+
+
+def test_status_cache_write_failure(runner, monkeypatch, tmp_path, project_file):
+    """Tests that an unwritable cache dir doesn't fail a successful lookup."""
+    import cli as cli_module
+
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(
+        cli_module.click, "get_app_dir", lambda name: str(blocker / "cicd-tool")
+    )
+    fake_api(monkeypatch, [FakeResponse(200, RUNS_BODY)])
+
+    result = runner.invoke(cli, ["status", "--config", project_file])
+
+    assert result.exit_code == 0
+    assert "1  completed/success" in result.output
+
+
+def test_plan_skips_diff_when_unchanged(runner, project_file_content, monkeypatch):
+    """Tests that plan reports no changes without running difflib."""
+    import cli as cli_module
+
+    def fail(*args, **kwargs):
+        raise AssertionError("difflib should not run for identical files")
+
+    monkeypatch.setattr(cli_module.difflib, "unified_diff", fail)
+
+    with runner.isolated_filesystem():
+        with open("project.yaml", "w") as f:
+            f.write(project_file_content)
+
+        template_dir = Path("dummy_templates/github")
+        template_dir.mkdir(parents=True, exist_ok=True)
+        with open(template_dir / "ci.yml.j2", "w") as f:
+            f.write("Hello from a dummy template! Branches: {{ branches|join(', ') }}")
+
+        args = ["--config", "project.yaml", "--template-dir", str(template_dir.parent)]
+        assert runner.invoke(cli, ["init", *args]).exit_code == 0
+
+        result = runner.invoke(cli, ["plan", *args])
+
+        assert result.exit_code == 0
+        assert "No changes." in result.output
+
+
+def test_persistent_gateway_error_is_reported(
+    runner, project_file_content, monkeypatch, tmp_path
+):
+    """Tests that retries running out on a 502 end in a ClickException."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import cli as cli_module
+
+    hits = []
+
+    class BadGateway(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), BadGateway)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+    cli_module._session.cache_clear()
+    session = cli_module._session()
+    # route the plain-http test server through the same retrying adapter
+    session.mount("http://", session.get_adapter("https://api.github.com"))
+    monkeypatch.setattr(cli_module, "GITHUB_API", f"http://127.0.0.1:{srv.server_port}")
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", lambda s: None)
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(cli_module.click, "get_app_dir", lambda name: str(tmp_path))
+
+    try:
+        with runner.isolated_filesystem():
+            with open("project.yaml", "w") as f:
+                f.write(project_file_content)
+            result = runner.invoke(cli, ["status", "--config", "project.yaml"])
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        cli_module._session.cache_clear()
+
+    assert result.exit_code == 1
+    assert "failed: 502" in result.output
+    assert len(hits) == 4  # first try plus three retries
+
+
+def test_poll_run_conditional_requests(monkeypatch):
+    """Tests that _poll_run sends the ETag back and skips decoding 304s."""
+    import cli as cli_module
+
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(
+                200, {"status": "in_progress", "conclusion": None}, {"ETag": '"e1"'}
+            ),
+            FakeResponse(304, headers={"X-Poll-Interval": "7"}),
+            FakeResponse(429, headers={"Retry-After": "30"}),
+            FakeResponse(
+                200, {"status": "completed", "conclusion": "success"}, {"ETag": '"e2"'}
+            ),
+        ],
+    )
+    sleeps = []
+    monkeypatch.setattr(cli_module.time, "sleep", sleeps.append)
+
+    run = cli_module._poll_run({"repository": "my-org/my-repo"}, "t", 42)
+
+    assert run["conclusion"] == "success"
+    assert calls[0]["path"] == "/repos/my-org/my-repo/actions/runs/42"
+    assert [c["headers"] for c in calls] == [None] + [{"If-None-Match": '"e1"'}] * 3
+    assert sleeps == [5, 7, 30]
+
+
+def test_poll_run_reports_errors(monkeypatch):
+    """Tests that a non-retryable error response ends the watch with a message."""
+    import click
+
+    import cli as cli_module
+
+    fake_api(monkeypatch, [FakeResponse(404, {"message": "Not Found"})])
+
+    with pytest.raises(click.ClickException, match="Run lookup failed: 404"):
+        cli_module._poll_run({"repository": "my-org/my-repo"}, "t", 42)
+
+
+def test_poll_delay():
+    """Tests that GitHub's back-off headers override the default interval."""
+    from cli import _poll_delay
+
+    assert _poll_delay(FakeResponse()) == 5
+    assert _poll_delay(FakeResponse(headers={"X-Poll-Interval": "12"})) == 12
+    assert _poll_delay(FakeResponse(headers={"Retry-After": "60"})) == 60
+    assert (
+        _poll_delay(FakeResponse(headers={"Retry-After": "3", "X-Poll-Interval": "9"}))
+        == 3
+    )
+    assert _poll_delay(FakeResponse(headers={"Retry-After": "soon"})) == 5
+
+
+@pytest.fixture
+def webhook_server():
+    import threading
+
+    import cli as cli_module
+
+    srv = cli_module._webhook_server(0, 42)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def deliver(srv, body: bytes, signature=None, headers=None):
+    import hashlib
+    import hmac
+    import http.client
+
+    if signature is None:
+        signature = "sha256=" + hmac.new(srv.secret, body, hashlib.sha256).hexdigest()
+    conn = http.client.HTTPConnection("127.0.0.1", srv.server_port, timeout=5)
+    conn.putrequest("POST", "/")
+    sent = {
+        "Content-Length": str(len(body)),
+        "X-GitHub-Event": "workflow_run",
+        "X-Hub-Signature-256": signature,
+        **(headers or {}),
+    }
+    for k, v in sent.items():
+        if v is not None:
+            conn.putheader(k, v)
+    conn.endheaders()
+    conn.send(body)
+    status = conn.getresponse().status
+    conn.close()
+    return status
+
+
+def test_webhook_handler(webhook_server):
+    """Tests signature checks and which deliveries complete the wait."""
+
+    def event(run_id):
+        return json.dumps(
+            {
+                "action": "completed",
+                "workflow_run": {
+                    "id": run_id,
+                    "status": "completed",
+                    "conclusion": "success",
+                },
+            }
+        ).encode()
+
+    # only reachable locally unless --webhook-host says otherwise
+    assert webhook_server.server_address[0] == "127.0.0.1"
+    assert deliver(webhook_server, event(42), signature="sha256=bad") == 401
+    missing = {"X-Hub-Signature-256": None}
+    assert deliver(webhook_server, event(42), headers=missing) == 401
+    assert deliver(webhook_server, b"", headers={"Content-Length": "abc"}) == 400
+    assert not webhook_server.done.is_set()
+
+    assert deliver(webhook_server, event(7)) == 204
+    assert not webhook_server.done.is_set()
+
+    assert deliver(webhook_server, event(42)) == 204
+    # the handler replies before it records the run
+    assert webhook_server.done.wait(5)
+    assert webhook_server.run["conclusion"] == "success"
+
+
+def test_wait_webhook_times_out_to_polling(monkeypatch):
+    """Tests that a webhook that never delivers falls back and removes the hook."""
+    import cli as cli_module
+
+    in_progress = {"status": "in_progress", "conclusion": None}
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(201, {"id": 9}),
+            FakeResponse(200, in_progress),
+            FakeResponse(200, in_progress),
+            FakeResponse(204),
+        ],
+    )
+
+    j = cli_module._wait_webhook(
+        {"repository": "my-org/my-repo"}, "t", 42, 0, "https://example.com", 1
+    )
+
+    assert j is None
+    assert [(c["method"], c["path"]) for c in calls][-1] == (
+        "DELETE",
+        "/repos/my-org/my-repo/hooks/9",
+    )
+
+
+@pytest.mark.parametrize(
+    "final, exit_code",
+    [
+        ({"status": "completed", "conclusion": "success"}, 0),
+        # still cleaning up, but the conclusion is already known to be bad
+        ({"status": "in_progress", "conclusion": "failure"}, 1),
+    ],
+)
+def test_run_fail_fast(runner, project_file, monkeypatch, final, exit_code):
+    """Tests that run --fail-fast exits non-zero unless the run succeeded."""
+    import cli as cli_module
+
+    run = {"id": 42, "html_url": "https://example.com/42"}
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(200, {"workflow_runs": []}),
+            FakeResponse(204),
+            FakeResponse(200, {"workflow_runs": [run]}),
+            FakeResponse(200, {"status": "queued", "conclusion": None}),
+            FakeResponse(200, final),
+        ],
+    )
+    monkeypatch.setattr(cli_module.time, "sleep", lambda s: None)
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+
+    result = runner.invoke(cli, ["run", "--config", project_file, "--fail-fast"])
+
+    assert result.exit_code == exit_code
+    assert f"{final['status']}/{final['conclusion']}" in result.output
+    assert len(calls) == 5  # nothing polled after the run is known to be done
+
+
+def test_run_fail_fast_requires_watch(runner, project_file, monkeypatch):
+    """Tests that --fail-fast is rejected when the run isn't watched."""
+    calls = fake_api(monkeypatch, [])
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+
+    result = runner.invoke(
+        cli, ["run", "--config", project_file, "--fail-fast", "--no-watch"]
+    )
+
+    assert result.exit_code == 2
+    assert "--fail-fast needs --watch" in result.output
+    assert calls == []
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Patch time.sleep to advance a fake time.monotonic instead of blocking."""
+    import cli as cli_module
+
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(cli_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cli_module.time, "sleep", sleep)
+    return now
+
+
+def test_find_dispatched_run(monkeypatch, fake_clock):
+    """Tests that the run lookup retries until the dispatched run shows up."""
+    import cli as cli_module
+
+    run = {"id": 42, "html_url": "https://example.com/42"}
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(200, {"workflow_runs": []}),
+            FakeResponse(200, {"workflow_runs": []}),
+            FakeResponse(200, {"workflow_runs": [run]}),
+        ],
+    )
+
+    found = cli_module._find_dispatched_run(
+        {"repository": "my-org/my-repo"}, "t", "main", 0
+    )
+
+    assert found == run
+    assert len(calls) == 3
+    assert calls[0]["params"]["event"] == "workflow_dispatch"
+    assert fake_clock[0] == 1.0
+
+
+def test_run_skips_older_dispatch_runs(runner, project_file, monkeypatch, fake_clock):
+    """Tests that run ignores a pre-existing dispatch run listed before its own."""
+    older = {"id": 41, "html_url": "https://example.com/41"}
+    ours = {"id": 42, "html_url": "https://example.com/42"}
+    calls = fake_api(
+        monkeypatch,
+        [
+            FakeResponse(200, {"workflow_runs": [older]}),
+            FakeResponse(204),
+            # GitHub hasn't listed the new run yet; the newest is still the old one
+            FakeResponse(200, {"workflow_runs": [older]}),
+            FakeResponse(200, {"workflow_runs": [ours]}),
+        ],
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+
+    result = runner.invoke(cli, ["run", "--config", project_file, "--no-watch"])
+
+    assert result.exit_code == 0
+    assert "Run: 42 -> https://example.com/42" in result.output
+    assert [c["method"] for c in calls] == ["GET", "POST", "GET", "GET"]
+
+
+def test_find_dispatched_run_timeout(monkeypatch, fake_clock):
+    """Tests that the lookup gives up once its time budget is spent."""
+    import click
+
+    import cli as cli_module
+
+    fake_api(monkeypatch, [FakeResponse(200, {"workflow_runs": []}) for _ in range(5)])
+
+    with pytest.raises(click.ClickException, match="did not show up within 2s"):
+        cli_module._find_dispatched_run(
+            {"repository": "my-org/my-repo"}, "t", "main", 0, timeout=2
+        )
+
+
+def test_find_dispatched_run_error(monkeypatch, fake_clock):
+    """Tests that an API error is reported instead of waiting out the budget."""
+    import click
+
+    import cli as cli_module
+
+    fake_api(monkeypatch, [FakeResponse(401, {"message": "Bad credentials"})])
+
+    with pytest.raises(click.ClickException, match="Run lookup failed: 401"):
+        cli_module._find_dispatched_run(
+            {"repository": "my-org/my-repo"}, "t", "main", 0
+        )
+
+
+def fake_api_by_path(monkeypatch, responses):
+    """Like fake_api, but keyed on path, for calls made from worker threads."""
+    import cli as cli_module
+
+    def fake_gh_api(token, method, path, headers=None, **kw):
+        return responses[path]
+
+    monkeypatch.setattr(cli_module, "gh_api", fake_gh_api)
+
+
+def status_responses(jobs_status=200):
+    def run(run_id):
+        return {
+            "id": run_id,
+            "status": "completed",
+            "conclusion": "success",
+            "html_url": f"https://example.com/{run_id}",
+        }
+
+    def jobs(run_id):
+        body = {"jobs": [{"name": f"build-{run_id}", "status": "completed"}]}
+        return FakeResponse(jobs_status, body if jobs_status == 200 else {})
+
+    return {
+        "/repos/my-org/my-repo/actions/runs": FakeResponse(
+            200, {"workflow_runs": [run(1), run(2)]}
+        ),
+        "/repos/my-org/my-repo/actions/runs/1/jobs": jobs(1),
+        "/repos/my-org/my-repo/actions/runs/2/jobs": jobs(2),
+    }
+
+
+def test_status_show_jobs(runner, project_file, monkeypatch, tmp_path):
+    """Tests that --show-jobs lists each run's jobs under it, in run order."""
+    import cli as cli_module
+
+    fake_api_by_path(monkeypatch, status_responses())
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(cli_module.click, "get_app_dir", lambda name: str(tmp_path))
+
+    result = runner.invoke(cli, ["status", "--config", project_file, "--show-jobs"])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("1  completed/success")
+    assert lines[1] == "    build-1  completed/None"
+    assert lines[2].startswith("2  completed/success")
+    assert lines[3] == "    build-2  completed/None"
+
+
+def test_status_show_jobs_errors(runner, project_file, monkeypatch, tmp_path):
+    """Tests that a failed job lookup and a zero worker count are reported."""
+    import cli as cli_module
+
+    fake_api_by_path(monkeypatch, status_responses(jobs_status=403))
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setattr(cli_module.click, "get_app_dir", lambda name: str(tmp_path))
+
+    result = runner.invoke(cli, ["status", "--config", project_file, "--show-jobs"])
+    assert result.exit_code == 1
+    assert "Job lookup for run 1 failed: 403" in result.output
+
+    # below 1 or above the connection pool size is a usage error
+    for workers in ("0", "9"):
+        result = runner.invoke(
+            cli,
+            ["status", "--config", project_file, "--show-jobs", "--workers", workers],
+        )
+        assert result.exit_code == 2
+        assert "--workers" in result.output
+
+
+def test_slack_notice_is_sent_before_run_exits(runner, project_file, monkeypatch):
+    """Tests that _watch doesn't block on Slack but run still delivers the notice."""
+    import threading
+
+    import cli as cli_module
+
+    release = threading.Event()
+    sent = []
+
+    def slow_slack(text, webhook):
+        release.wait(5)
+        sent.append(text)
+
+    monkeypatch.setattr(cli_module, "slack_notify", slow_slack)
+    monkeypatch.setattr(
+        cli_module,
+        "_poll_run",
+        lambda proj, token, run_id: {"status": "completed", "conclusion": "success"},
+    )
+    proj = {
+        "repository": "my-org/my-repo",
+        "notifications": {"slack_webhook": "https://hooks.example.com/x"},
+    }
+
+    # _watch hands the POST to a thread and returns right away
+    j, notifier = cli_module._watch(proj, "t", 42)
+    assert j["conclusion"] == "success"
+    assert notifier.is_alive() and not notifier.daemon
+    release.set()
+    notifier.join(5)
+
+    # and run waits for it, so the message goes out before the CLI exits
+    Path(project_file).write_text(
+        Path(project_file).read_text()
+        + "notifications:\n  slack_webhook: https://hooks.example.com/x\n"
+    )
+    run = {"id": 42, "html_url": "https://example.com/42"}
+    fake_api(
+        monkeypatch,
+        [
+            FakeResponse(200, {"workflow_runs": []}),
+            FakeResponse(204),
+            FakeResponse(200, {"workflow_runs": [run]}),
+        ],
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+
+    result = runner.invoke(cli, ["run", "--config", project_file])
+
+    assert result.exit_code == 0
+    assert sent == ["CI for my-org/my-repo finished: success"] * 2